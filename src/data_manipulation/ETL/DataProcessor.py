@@ -1,4 +1,5 @@
 import os
+import re
 from pylinac.core.image import XIM
 import logging
 from pathlib import Path
@@ -15,6 +16,22 @@ from src.data_manipulation.models.ImageModel import ImageModel
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 
+# Beam identifier -> (model class, beam type)
+BEAM_MAP = {
+    "6e": (EBeamModel, "6e"),
+    "9e": (EBeamModel, "9e"),
+    "12e": (EBeamModel, "12e"),
+    "16e": (EBeamModel, "16e"),
+    "2.5x": (XBeamModel, "2.5x"),
+    "10x": (XBeamModel, "10x"),
+    "15x": (XBeamModel, "15x"),
+    "6x": (Geo6xfffModel, "6x"),  # Geometry checks use 6x as the beam type
+}
+
+# Finds the beam identifier in a folder name such as "...-BeamCheckTemplate16e".
+# The lookbehind keeps "6e" from matching inside "16e".
+BEAM_TYPE_RE = re.compile(r'(?<![\d.])(16e|12e|9e|6e|2\.5x|10x|15x|6x)')
+
 
 # Load environment variables from .env file in project root
 project_root = Path(__file__).parent.parent.parent.parent
@@ -29,21 +46,28 @@ class DataProcessor:
     to process data and images.
     """
 
-    def __init__(self, path: str):
+    def __init__(self, path: str = None):
         """
         Initialize the DataProcessor with the directory path containing beam data.
+        The path may be omitted and passed to Run() instead, so one processor
+        (and its database connection) can be reused across many folders.
         """
-        self.folder_path = path  # Store the folder path for uploads
-        self.data_path = os.path.join(path, "Results.csv")
-        self.image_path = os.path.join(path, "BeamProfileCheck.xim")
+        if path is not None:
+            self._set_folder(path)
 
         self.data_ex = data_extractor()
         self.image_ex = image_extractor()
         
-        # Database Uploader
+        # Database Uploader, connected on the first upload and kept open until close()
         self.up = Uploader()
         # If ran as test, coded so that no database connection is made
 
+    def _set_folder(self, path: str):
+        """Point the processor at the directory containing beam data."""
+        self.folder_path = path  # Store the folder path for uploads
+        self.data_path = os.path.join(path, "Results.csv")
+        self.image_path = os.path.join(path, "BeamProfileCheck.xim")
+
     # -------------------------------------------------------------------------
     # Generic helper method for beams
     # -------------------------------------------------------------------------
@@ -112,51 +136,44 @@ class DataProcessor:
             logger.info(f"Skipping EnhancedMLCCheckTemplate6x path (leaves not ingested): {self.data_path}")
             return
 
-        beam_map = {
-            "6e": (EBeamModel, "6e"),
-            "9e": (EBeamModel, "9e"),
-            "12e": (EBeamModel, "12e"),
-            "16e": (EBeamModel, "16e"),
-            "2.5x": (XBeamModel, "2.5x"),
-            "10x": (XBeamModel, "10x"),
-            "15x": (XBeamModel, "15x"),
-            "6x": (Geo6xfffModel, "6x"),  # Geometry checks use 6x as the beam type
-        }
-
-        for key, (model_class, beam_type) in beam_map.items():
-            if key in self.data_path:
-                # Special handling for 6x: use "6xFFF" only for BeamCheckTemplate6xFFF
-                if key == "6x":
-                    if "BeamCheckTemplate6xFFF" in self.data_path:
-                        beam_type = "6xFFF"
-                    # For other 6x templates (like GeometryCheckTemplate6xMVkVEnhancedCouch), use "6x"
-                
-                logger.info(f"{beam_type.upper()} Beam detected")
-
-                # Initialize the correct beam model (EBeam, XBeam, etc.)
-                beam = self._init_beam_model(model_class, beam_type)
-
-                # --- Image Extraction for all beam types ---
-                logger.info(f"Extracting image data for {beam_type} beam...")
-                beam.set_image_model(self._init_beam_image(beam_type, is_test))
-                
-                ##Unsure of the cleanliness of this soln
-                #Problem: Beams need to hold flatness and sym of images
-                #Sol1: Data processor will tell beam to get  its vals from image
-                # ^ implemented soln
-                # Alt Soln: Image holds a direct link to its beam (Doublely Linked) 
-                # and updates its parent beam stats as they are calculated
-                beam.set_flat_and_sym_vals_from_image()
-
-                if(is_test):
-                    logger.info("Running test extraction...")
-                    self.data_ex.extractTest(beam)
-                else:
-                    logger.info("Running normal extraction...")
-                    self.data_ex.extract(beam)
-                    logger.info("Uploading to Supabase...")
-                    #Set Up DataBase
-                    # Connect to database using environment variables
+        # Match on the folder name only, in a single regex pass
+        folder_name = os.path.basename(os.path.normpath(self.folder_path))
+        match = BEAM_TYPE_RE.search(folder_name)
+        if match:
+            key = match.group(1)
+            model_class, beam_type = BEAM_MAP[key]
+            # Special handling for 6x: use "6xFFF" only for BeamCheckTemplate6xFFF
+            if key == "6x":
+                if "BeamCheckTemplate6xFFF" in folder_name:
+                    beam_type = "6xFFF"
+                # For other 6x templates (like GeometryCheckTemplate6xMVkVEnhancedCouch), use "6x"
+            
+            logger.info(f"{beam_type.upper()} Beam detected")
+
+            # Initialize the correct beam model (EBeam, XBeam, etc.)
+            beam = self._init_beam_model(model_class, beam_type)
+
+            # --- Image Extraction for all beam types ---
+            logger.info(f"Extracting image data for {beam_type} beam...")
+            beam.set_image_model(self._init_beam_image(beam_type, is_test))
+            
+            ##Unsure of the cleanliness of this soln
+            #Problem: Beams need to hold flatness and sym of images
+            #Sol1: Data processor will tell beam to get  its vals from image
+            # ^ implemented soln
+            # Alt Soln: Image holds a direct link to its beam (Doublely Linked) 
+            # and updates its parent beam stats as they are calculated
+            beam.set_flat_and_sym_vals_from_image()
+
+            if(is_test):
+                logger.info("Running test extraction...")
+                self.data_ex.extractTest(beam)
+            else:
+                logger.info("Running normal extraction...")
+                self.data_ex.extract(beam)
+                logger.info("Uploading to Supabase...")
+                #Set Up DataBase once; later folders reuse the open connection
+                if(not self.up.connected):
                     # Connect to database using credentials from .env file
                     connection_params = {
                         "url": os.getenv("SUPABASE_URL"),
@@ -165,12 +182,11 @@ class DataProcessor:
                     if(not self.up.connect(connection_params)):
                         logger.error("Unable at connect to the database")
                         return
-                    if(not self.up.upload(beam)):
-                        logger.error("Cannot upload to the database")
-                        return
-                    logger.info("Beam Uploading Complete")
-                    self.up.close()
-                return
+                if(not self.up.upload(beam)):
+                    logger.error("Cannot upload to the database")
+                    return
+                logger.info("Beam Uploading Complete")
+            return
 
         # --- No beam type matched ---
         logger.error(f"Unknown or unsupported beam type for path: {self.data_path}")
@@ -180,18 +196,26 @@ class DataProcessor:
     # -------------------------------------------------------------------------
     # Public entrypoints
     # -------------------------------------------------------------------------
-    def Run(self):
-        """Run the normal data processing workflow."""
+    def Run(self, path: str = None):
+        """Run the normal data processing workflow, optionally on a new folder."""
+        if path is not None:
+            self._set_folder(path)
         self._process_beam(is_test=False)
 
-    def RunTest(self):
+    def RunTest(self, path: str = None):
         """ Run the test data processing workflow.
             For Testing Print logger.info to console
         """
+        if path is not None:
+            self._set_folder(path)
         logging.basicConfig(
             level=logging.INFO,
             format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
         self._process_beam(is_test=True)
 
+    def close(self):
+        """Close the database connection held across Run() calls."""
+        self.up.close()
+
     
\ No newline at end of file
@@ -18,15 +18,25 @@ Supported beam models:
 
 from abc import ABC, abstractmethod
 from datetime import datetime, date
-from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional, Sequence
 import logging
 import os
-import json
 
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 
+# Column order of the value tuples sent by uploadMLCLeaves / uploadMLCBacklash
+_MLC_LEAF_COLUMNS = ('date', 'machine_sn', 'leaf_bank', 'leaf_index', 'leaf_value')
+_MLC_BACKLASH_COLUMNS = ('date', 'machine_sn', 'leaf_bank', 'leaf_index', 'backlash_value')
+
+# Rows those helpers send: leaves 1-60 for each of the A and B banks
+_MLC_ROWS = 2 * 60
+
+
+def _to_float(value):
+    """Convert a numeric model value to float, passing None through."""
+    return None if value is None else float(value)
+
 
 class DatabaseAdapter(ABC):
     """
@@ -63,6 +73,32 @@ class DatabaseAdapter(ABC):
         """
         pass
 
+    def upload_beam_data_bulk(self, table_name: str, rows: Iterable[Any],
+                              columns: Optional[Sequence[str]] = None) -> int:
+        """
+        Upload several rows to the specified table.
+        
+        The default implementation falls back to one upload_beam_data() call per
+        row; adapters that support multi-row inserts should override it.
+        
+        Args:
+            table_name: Name of the database table
+            rows: Iterable of rows (may be a generator). Each row is a dictionary,
+                or a tuple of values in `columns` order when `columns` is given
+            columns: Optional column names for tuple rows
+        
+        Returns:
+            int: Number of rows uploaded successfully
+        """
+        if columns is not None:
+            rows = (dict(zip(columns, row)) for row in rows)
+
+        success_count = 0
+        for row in rows:
+            if self.upload_beam_data(table_name, row):
+                success_count += 1
+        return success_count
+
     @abstractmethod
     def close(self):
         """Close the database connection."""
@@ -78,6 +114,8 @@ class SupabaseAdapter(DatabaseAdapter):
     def __init__(self):
         self.client = None
         self.connected = False
+        # Machine IDs already confirmed to exist in the machines table
+        self._known_machines = set()
 
     def connect(self, connection_params: Dict[str, Any]) -> bool:
         """
@@ -99,6 +137,7 @@ class SupabaseAdapter(DatabaseAdapter):
                 return False
             
             self.client: Client = create_client(url, key)
+            self._known_machines.clear()
             self.connected = True
             logger.info("Successfully connected to Supabase")
             return True
@@ -127,12 +166,17 @@ class SupabaseAdapter(DatabaseAdapter):
             logger.error("Not connected to Supabase")
             return False
         
+        # Skip the round-trip for machines already seen on this connection
+        if machine_id in self._known_machines:
+            return True
+        
         try:
             # Check if machine exists
             response = self.client.table('machines').select('id').eq('id', machine_id).execute()
             
             if response.data and len(response.data) > 0:
                 logger.debug(f"Machine {machine_id} already exists")
+                self._known_machines.add(machine_id)
                 return True
             
             # Machine doesn't exist, create it
@@ -160,6 +204,7 @@ class SupabaseAdapter(DatabaseAdapter):
             
             if response.data:
                 logger.info(f"Created machine {machine_id} in location {location}")
+                self._known_machines.add(machine_id)
                 return True
             else:
                 logger.warning(f"No data returned when creating machine {machine_id}")
@@ -192,7 +237,7 @@ class SupabaseAdapter(DatabaseAdapter):
                 if not self.ensure_machine_exists(machine_id, path):
                     logger.warning(f"Could not ensure machine {machine_id} exists, but continuing with upload attempt")
             
-            # Convert Decimal to float for JSON serialization
+            # Convert dates to ISO strings for JSON serialization
             serialized_data = self._serialize_data(data)
             logger.debug(f"Uploading data to {table_name}: {serialized_data}")
             
@@ -210,6 +255,69 @@ class SupabaseAdapter(DatabaseAdapter):
             logger.error(f"Error uploading data to Supabase: {e}", exc_info=True)
             return False
 
+    def upload_beam_data_bulk(self, table_name: str, rows: Iterable[Any],
+                              columns: Optional[Sequence[str]] = None) -> int:
+        """
+        Upload several rows to a Supabase table with a single multi-row insert.
+        
+        Args:
+            table_name: Name of the Supabase table
+            rows: Iterable of rows (may be a generator). Each row is a dictionary,
+                or a tuple of values in `columns` order when `columns` is given
+            columns: Optional column names for tuple rows
+        
+        Returns:
+            int: Number of rows uploaded successfully (0 on failure)
+        """
+        if not self.connected or not self.client:
+            logger.error("Not connected to Supabase")
+            return 0
+        
+        try:
+            # Serialize in a single pass, noting which machines are referenced
+            serialized_rows = []
+            machine_ids = set()
+            if columns is None:
+                for row in rows:
+                    machine_id = row.get('machine_id')
+                    if machine_id:
+                        machine_ids.add(machine_id)
+                    serialized_rows.append(self._serialize_data(row))
+            else:
+                # Tuple rows go straight to their serialized dict, one per row
+                machine_idx = columns.index('machine_id') if 'machine_id' in columns else None
+                serialize = self._serialize_value
+                for row in rows:
+                    if machine_idx is not None and row[machine_idx]:
+                        machine_ids.add(row[machine_idx])
+                    serialized_rows.append({key: serialize(value) for key, value in zip(columns, row)})
+            
+            if not serialized_rows:
+                return 0
+            
+            # Ensure every referenced machine exists before uploading the rows
+            for machine_id in machine_ids:
+                if not self.ensure_machine_exists(machine_id):
+                    logger.warning(f"Could not ensure machine {machine_id} exists, but continuing with upload attempt")
+            
+            logger.debug(f"Uploading {len(serialized_rows)} rows to {table_name}")
+            
+            # Insert all rows in one request instead of one round-trip per row.
+            # PostgREST runs a multi-row insert as a single statement, so the
+            # rows are committed together or not at all.
+            response = self.client.table(table_name).insert(serialized_rows).execute()
+            
+            if response.data:
+                logger.info(f"Successfully uploaded {len(response.data)} rows to {table_name}")
+                return len(response.data)
+            else:
+                logger.warning(f"No data returned from {table_name} bulk insert")
+                return 0
+                
+        except Exception as e:
+            logger.error(f"Error bulk uploading data to {table_name}: {e}", exc_info=True)
+            return 0
+
     def upload_geocheck_data(self, data: Dict[str, Any], path: str = None) -> Optional[str]:
         """
         Upload geometry check data to geochecks table.
@@ -239,7 +347,7 @@ class SupabaseAdapter(DatabaseAdapter):
             data.pop('mlc_backlash_a', None)
             data.pop('mlc_backlash_b', None)
             
-            # Convert Decimal to float for JSON serialization
+            # Convert dates to ISO strings for JSON serialization
             serialized_data = self._serialize_data(data)
             logger.debug(f"Uploading geocheck data: {serialized_data}")
             
@@ -286,7 +394,7 @@ class SupabaseAdapter(DatabaseAdapter):
                 leaf_record = {
                     'geocheck_id': geocheck_id,
                     'leaf_number': leaf.get('leaf_number'),
-                    'leaf_value': float(leaf.get('leaf_value')) if leaf.get('leaf_value') is not None else None
+                    'leaf_value': _to_float(leaf.get('leaf_value'))
                 }
                 upload_data.append(leaf_record)
             
@@ -332,7 +440,7 @@ class SupabaseAdapter(DatabaseAdapter):
                 backlash_record = {
                     'geocheck_id': geocheck_id,
                     'leaf_number': backlash.get('leaf_number'),
-                    'backlash_value': float(backlash.get('backlash_value')) if backlash.get('backlash_value') is not None else None
+                    'backlash_value': _to_float(backlash.get('backlash_value'))
                 }
                 upload_data.append(backlash_record)
             
@@ -360,23 +468,22 @@ class SupabaseAdapter(DatabaseAdapter):
         Returns:
             Dictionary with serialized values
         """
-        serialized = {}
-        for key, value in data.items():
-            if isinstance(value, Decimal):
-                serialized[key] = float(value)
-            elif isinstance(value, (datetime, date)):
-                # Convert both datetime and date objects to ISO format strings
-                serialized[key] = value.isoformat()
-            elif value is None:
-                serialized[key] = None
-            else:
-                serialized[key] = value
-        return serialized
+        serialize = self._serialize_value
+        return {key: serialize(value) for key, value in data.items()}
+
+    @staticmethod
+    def _serialize_value(value: Any) -> Any:
+        """Convert a single value to a JSON-serializable format."""
+        if isinstance(value, (datetime, date)):
+            # Convert both datetime and date objects to ISO format strings
+            return value.isoformat()
+        return value
 
     def close(self):
         """Close the Supabase connection."""
         self.client = None
         self.connected = False
+        self._known_machines.clear()
         logger.info("Supabase connection closed")
 
 
@@ -553,13 +660,10 @@ class Uploader:
                     'value': sym_hori
                 })
             
-            # Upload each metric record
-            success_count = 0
-            for metric_data in metrics:
-                if self.db_adapter.upload_beam_data('baselines', metric_data):
-                    success_count += 1
-                else:
-                    logger.error(f"Failed to upload baseline metric: {metric_data['metric_type']}")
+            # Upload all metric records in a single batch so they are committed together
+            success_count = self.db_adapter.upload_beam_data_bulk('baselines', metrics)
+            if success_count != len(metrics):
+                logger.error(f"Failed to upload baseline metrics: {[m['metric_type'] for m in metrics]}")
             
             logger.error(f"Uploaded {success_count}/{len(metrics)} baseline metric records")
             return success_count == len(metrics) and len(metrics) > 0
@@ -683,8 +787,8 @@ class Uploader:
         For regular beams: Uploads single record to beam table.
         
         Note: Geometry models have additional data (isocenter, gantry, couch, MLC, jaws) 
-        that is not stored in the basic beam table. The full extraction code is 
-        commented out below for easy re-enabling when geometry tables are created.
+        that is not stored in the basic beam table. It is not uploaded until the
+        geochecks table described in GEOCHECK_API.md is wired up.
         """
         try:
             # Check if this is a baseline
@@ -707,115 +811,7 @@ class Uploader:
                     'machine_id': geoModel.get_machine_SN(),
                     'note': None  # Add note if available in the model
                 }
-                result = self.db_adapter.upload_beam_data('beams', data)
-            
-            # ========================================================================
-            # COMMENTED OUT: Full geometry data extraction
-            # Uncomment when geometry_data table is created
-            # ========================================================================
-            
-            # ---- Extract IsoCenterGroup data ----
-            isocenter_data = {
-                'beam_id': result_id,  # Foreign key to beam table
-                'isoCenterSize': geoModel.get_IsoCenterSize(),
-                'isoCenterMVOffset': geoModel.get_IsoCenterMVOffset(),
-                'isoCenterKVOffset': geoModel.get_IsoCenterKVOffset(),
-            }
-            
-            # ---- Extract CollimationGroup data ----
-            collimation_data = {
-                'beam_id': result_id,
-                'collimationRotationOffset': geoModel.get_CollimationRotationOffset(),
-            }
-            
-            # ---- Extract GantryGroup data ----
-            gantry_data = {
-                'beam_id': result_id,
-                'gantryAbsolute': geoModel.get_GantryAbsolute(),
-                'gantryRelative': geoModel.get_GantryRelative(),
-            }
-            
-            # ---- Extract EnhancedCouchGroup data ----
-            couch_data = {
-                'beam_id': result_id,
-                'couchMaxPositionError': geoModel.get_CouchMaxPositionError(),
-                'couchLat': geoModel.get_CouchLat(),
-                'couchLng': geoModel.get_CouchLng(),
-                'couchVrt': geoModel.get_CouchVrt(),
-                'couchRtnFine': geoModel.get_CouchRtnFine(),
-                'couchRtnLarge': geoModel.get_CouchRtnLarge(),
-                'rotationInducedCouchShiftFullRange': geoModel.get_RotationInducedCouchShiftFullRange(),
-            }
-            
-            # ---- Extract MLC Leaves data (A and B banks, leaves 11-50) ----
-            mlc_leaves_a = {}
-            mlc_leaves_b = {}
-            for i in range(11, 51):
-                mlc_leaves_a[f"leaf_{i}"] = geoModel.get_MLCLeafA(i)
-                mlc_leaves_b[f"leaf_{i}"] = geoModel.get_MLCLeafB(i)
-            
-            # ---- Extract MLC Offsets ----
-            mlc_offset_data = {
-                'beam_id': result_id,
-                'mlcMaxOffsetA': geoModel.get_MaxOffsetA(),
-                'mlcMaxOffsetB': geoModel.get_MaxOffsetB(),
-                'mlcMeanOffsetA': geoModel.get_MeanOffsetA(),
-                'mlcMeanOffsetB': geoModel.get_MeanOffsetB(),
-                'mlcLeavesA': json.dumps(mlc_leaves_a),  # Store as JSONB
-                'mlcLeavesB': json.dumps(mlc_leaves_b),  # Store as JSONB
-            }
-            
-            # ---- Extract MLC Backlash data (A and B banks, leaves 11-50) ----
-            mlc_backlash_a = {}
-            mlc_backlash_b = {}
-            for i in range(11, 51):
-                mlc_backlash_a[f"leaf_{i}"] = geoModel.get_MLCBacklashA(i)
-                mlc_backlash_b[f"leaf_{i}"] = geoModel.get_MLCBacklashB(i)
-            
-            mlc_backlash_data = {
-                'beam_id': result_id,
-                'mlcBacklashMaxA': geoModel.get_MLCBacklashMaxA(),
-                'mlcBacklashMaxB': geoModel.get_MLCBacklashMaxB(),
-                'mlcBacklashMeanA': geoModel.get_MLCBacklashMeanA(),
-                'mlcBacklashMeanB': geoModel.get_MLCBacklashMeanB(),
-                'mlcBacklashA': json.dumps(mlc_backlash_a),  # Store as JSONB
-                'mlcBacklashB': json.dumps(mlc_backlash_b),  # Store as JSONB
-            }
-            
-            # ---- Extract Jaws data ----
-            jaws_data = {
-                'beam_id': result_id,
-                'jawX1': geoModel.get_JawX1(),
-                'jawX2': geoModel.get_JawX2(),
-                'jawY1': geoModel.get_JawY1(),
-                'jawY2': geoModel.get_JawY2(),
-            }
-            
-            # ---- Extract Jaw Parallelism data ----
-            jaw_parallelism_data = {
-                'beam_id': result_id,
-                'jawParallelismX1': geoModel.get_JawParallelismX1(),
-                'jawParallelismX2': geoModel.get_JawParallelismX2(),
-                'jawParallelismY1': geoModel.get_JawParallelismY1(),
-                'jawParallelismY2': geoModel.get_JawParallelismY2(),
-            }
-            
-            # ---- Upload to geometry tables ----
-            # Uncomment and adjust table names when geometry tables are created
-            self.db_adapter.upload_beam_data('geometry_isocenter', isocenter_data)
-            self.db_adapter.upload_beam_data('geometry_collimation', collimation_data)
-            self.db_adapter.upload_beam_data('geometry_gantry', gantry_data)
-            self.db_adapter.upload_beam_data('geometry_couch', couch_data)
-            self.db_adapter.upload_beam_data('geometry_mlc', mlc_offset_data)
-            self.db_adapter.upload_beam_data('geometry_mlc_backlash', mlc_backlash_data)
-            self.db_adapter.upload_beam_data('geometry_jaws', jaws_data)
-            self.db_adapter.upload_beam_data('geometry_jaw_parallelism', jaw_parallelism_data)
-            
-            # ========================================================================
-            # END OF COMMENTED GEOMETRY DATA
-            # ========================================================================
-            
-            return result
+                return self.db_adapter.upload_beam_data('beams', data)
 
         except Exception as e:
             logger.error(f"Error during Geo model upload: {e}", exc_info=True)
@@ -827,37 +823,27 @@ class Uploader:
         This can be called after geoModelUpload() if you want to store
         individual leaf data in a separate table.
         """
+        if not self.connected:
+            logger.error("Not connected to database. Call connect() first.")
+            return False
+
         try:
-            leaves_data = []
+            date = geoModel.get_date()
+            machine_sn = geoModel.get_machine_SN()
             
-            # Collect all MLC leaf A data (leaves 1-60)
-            for i in range(1, 61):
-                leaves_data.append({
-                    'date': geoModel.get_date(),
-                    'machine_sn': geoModel.get_machine_SN(),
-                    'leaf_bank': 'A',
-                    'leaf_index': i,
-                    'leaf_value': geoModel.get_MLCLeafA(i),
-                })
-            
-            # Collect all MLC leaf B data (leaves 1-60)
-            for i in range(1, 61):
-                leaves_data.append({
-                    'date': geoModel.get_date(),
-                    'machine_sn': geoModel.get_machine_SN(),
-                    'leaf_bank': 'B',
-                    'leaf_index': i,
-                    'leaf_value': geoModel.get_MLCLeafB(i),
-                })
+            # Stream all MLC leaf A and B records (leaves 1-60) straight into
+            # the bulk insert as value tuples instead of building per-row dicts
+            leaves_data = (
+                (date, machine_sn, bank, i, value)
+                for bank, values in (('A', geoModel.get_MLCLeafValuesA()), ('B', geoModel.get_MLCLeafValuesB()))
+                for i, value in enumerate(values, 1)
+            )
             
-            # Upload each leaf record
-            success_count = 0
-            for leaf_data in leaves_data:
-                if self.db_adapter.upload_beam_data(table_name, leaf_data):
-                    success_count += 1
+            # Upload all leaf records in a single bulk insert
+            success_count = self.db_adapter.upload_beam_data_bulk(table_name, leaves_data, _MLC_LEAF_COLUMNS)
             
-            logger.info(f"Uploaded {success_count}/{len(leaves_data)} MLC leaf records")
-            return success_count == len(leaves_data)
+            logger.info(f"Uploaded {success_count}/{_MLC_ROWS} MLC leaf records")
+            return success_count == _MLC_ROWS
 
         except Exception as e:
             logger.error(f"Error uploading MLC leaves: {e}", exc_info=True)
@@ -869,45 +855,28 @@ class Uploader:
         This can be called after geoModelUpload() if you want to store
         individual backlash data in a separate table.
         """
+        if not self.connected:
+            logger.error("Not connected to database. Call connect() first.")
+            return False
+
         try:
-            backlash_data = []
-            
-            # Collect all MLC backlash A data (leaves 1-60)
-            for i in range(1, 61):
-                backlash_data.append({
-                    'date': geoModel.get_date(),
-                    'machine_sn': geoModel.get_machine_SN(),
-                    'leaf_bank': 'A',
-                    'leaf_index': i,
-                    'backlash_value': geoModel.get_MLCBacklashA(i),
-                })
+            date = geoModel.get_date()
+            machine_sn = geoModel.get_machine_SN()
             
-            # Collect all MLC backlash B data (leaves 1-60)
-            for i in range(1, 61):
-                backlash_data.append({
-                    'date': geoModel.get_date(),
-                    'machine_sn': geoModel.get_machine_SN(),
-                    'leaf_bank': 'B',
-                    'leaf_index': i,
-                    'backlash_value': geoModel.get_MLCBacklashB(i),
-                })
+            # Stream all MLC backlash A and B records (leaves 1-60) straight into
+            # the bulk insert as value tuples instead of building per-row dicts
+            backlash_data = (
+                (date, machine_sn, bank, i, value)
+                for bank, values in (('A', geoModel.get_MLCBacklashValuesA()), ('B', geoModel.get_MLCBacklashValuesB()))
+                for i, value in enumerate(values, 1)
+            )
             
-            # Upload each backlash record
-            success_count = 0
-            for backlash_record in backlash_data:
-                if self.db_adapter.upload_beam_data(table_name, backlash_record):
-                    success_count += 1
+            # Upload all backlash records in a single bulk insert
+            success_count = self.db_adapter.upload_beam_data_bulk(table_name, backlash_data, _MLC_BACKLASH_COLUMNS)
             
-            logger.info(f"Uploaded {success_count}/{len(backlash_data)} MLC backlash records")
-            return success_count == len(backlash_data)
+            logger.info(f"Uploaded {success_count}/{_MLC_ROWS} MLC backlash records")
+            return success_count == _MLC_ROWS
 
         except Exception as e:
             logger.error(f"Error uploading MLC backlash: {e}", exc_info=True)
             return False
-
-    def close(self):
-        """Close the database connection."""
-        if self.db_adapter and hasattr(self.db_adapter, 'close'):
-            self.db_adapter.close()
-
-
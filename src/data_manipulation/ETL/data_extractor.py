@@ -15,13 +15,148 @@ Supported beam models:
 """
 
 import csv
-import decimal
 import logging
-from decimal import Decimal
+import os
+import re
+import sys
+from functools import lru_cache
 
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 
+# Sentinel stored for values that cannot be parsed as a number
+_NOT_A_NUMBER = -1.0
+
+
+def _to_number(value):
+    """Convert a Results.csv value to float, or _NOT_A_NUMBER if it is not numeric."""
+    try:
+        return float(value)
+    except ValueError:
+        return _NOT_A_NUMBER
+
+
+@lru_cache(maxsize=64)
+def _read_results(path, mtime_ns):
+    """
+    Parse a Results.csv file into (field, name, value) string tuples, where
+    field is the last path component of the name with its unit stripped.
+
+    mtime_ns is only part of the cache key, so a rewritten file is parsed
+    again while repeat extractions of an unchanged folder skip the parse.
+    """
+    with open(path, 'r', newline='', encoding='utf-8') as csvfile:
+        # Results.csv is only a few KB: read it in a single call and
+        # parse from memory rather than through buffered line reads.
+        # Fields are written as "name, value, ...": skipinitialspace drops the
+        # padding after each comma so neither the cells nor the header need stripping.
+        reader = csv.reader(csvfile.read().splitlines(True), skipinitialspace=True)
+
+        # Locate the needed columns once from the header row
+        header = next(reader, [])
+        name_idx = header.index('Name [Unit]')
+        value_idx = header.index('Value')
+        min_len = max(name_idx, value_idx) + 1
+
+        rows = []
+        for row in reader:
+            if len(row) < min_len:
+                continue
+            name = row[name_idx]
+            value = row[value_idx]
+            if not name or not value:
+                continue
+            # "IsoCenterGroup/IsoCenterSize [mm]" -> "IsoCenterSize", interned so
+            # the setter-table lookups match the literal keys by identity
+            field = sys.intern(name.split('[', 1)[0].rstrip().rpartition('/')[2])
+            rows.append((field, name, value))
+
+    return tuple(rows)
+
+
+# Results.csv field name (last path component, unit stripped) -> model setter
+_E_SETTERS = {
+    'BeamOutputChange': 'set_relative_output',
+    'BeamUniformityChange': 'set_relative_uniformity',
+}
+
+_X_SETTERS = {
+    'BeamOutputChange': 'set_relative_output',
+    'BeamUniformityChange': 'set_relative_uniformity',
+    'BeamCenterShift': 'set_center_shift',
+}
+
+_GEO_SETTERS = {
+    # ---- IsoCenterGroup ----
+    'IsoCenterSize': 'set_IsoCenterSize',
+    'IsoCenterMVOffset': 'set_IsoCenterMVOffset',
+    'IsoCenterKVOffset': 'set_IsoCenterKVOffset',
+
+    # ---- BeamGroup ----
+    'BeamOutputChange': 'set_relative_output',
+    'BeamUniformityChange': 'set_relative_uniformity',
+    'BeamCenterShift': 'set_center_shift',
+
+    # ---- CollimationGroup ----
+    'CollimationRotationOffset': 'set_CollimationRotationOffset',
+
+    # ---- GantryGroup ----
+    'GantryAbsolute': 'set_GantryAbsolute',
+    'GantryRelative': 'set_GantryRelative',
+
+    # ---- EnhancedCouchGroup ----
+    'CouchMaxPositionError': 'set_CouchMaxPositionError',
+    'CouchLat': 'set_CouchLat',
+    'CouchLng': 'set_CouchLng',
+    'CouchVrt': 'set_CouchVrt',
+    'CouchRtnFine': 'set_CouchRtnFine',
+    'CouchRtnLarge': 'set_CouchRtnLarge',
+    'RotationInducedCouchShiftFullRange': 'set_RotationInducedCouchShiftFullRange',
+
+    # ---- MLC Offsets ----
+    'MLCMaxOffsetA': 'set_MaxOffsetA',
+    'MLCMaxOffsetB': 'set_MaxOffsetB',
+    'MLCMeanOffsetA': 'set_MeanOffsetA',
+    'MLCMeanOffsetB': 'set_MeanOffsetB',
+    'MaxOffsetA': 'set_MaxOffsetA',
+    'MaxOffsetB': 'set_MaxOffsetB',
+    'MeanOffsetA': 'set_MeanOffsetA',
+    'MeanOffsetB': 'set_MeanOffsetB',
+
+    # ---- MLC Backlash ----
+    'MLCBacklashMaxA': 'set_MLCBacklashMaxA',
+    'MLCBacklashMaxB': 'set_MLCBacklashMaxB',
+    'MLCBacklashMeanA': 'set_MLCBacklashMeanA',
+    'MLCBacklashMeanB': 'set_MLCBacklashMeanB',
+
+    # ---- Jaws Group ----
+    'JawX1': 'set_JawX1',
+    'JawX2': 'set_JawX2',
+    'JawY1': 'set_JawY1',
+    'JawY2': 'set_JawY2',
+
+    # ---- Jaws Parallelism ----
+    'JawParallelismX1': 'set_JawParallelismX1',
+    'JawParallelismX2': 'set_JawParallelismX2',
+    'JawParallelismY1': 'set_JawParallelismY1',
+    'JawParallelismY2': 'set_JawParallelismY2',
+}
+
+# MLC leaf group -> indexed Geo6xfffModel setter
+_GEO_LEAF_SETTERS = {
+    'MLCLeavesA': 'set_MLCLeafA',
+    'MLCLeavesB': 'set_MLCLeafB',
+    'MLCBacklashLeavesA': 'set_MLCBacklashA',
+    'MLCBacklashLeavesB': 'set_MLCBacklashB',
+}
+
+# ".../MLCLeavesA/MLCLeaf11 [mm]" -> ("MLCLeavesA", "11")
+_MLC_LEAF_RE = re.compile(r'(MLC(?:Backlash)?Leaves[AB])/MLC(?:Backlash)?Leaf(\d+)')
+
+# Model class -> (extraction, test extraction) method names, filled on first use
+_DISPATCH_CACHE = {}
+
+
 class data_extractor:
     """
     Handles data extraction from CSV files for various beam models.
@@ -29,6 +164,28 @@ class data_extractor:
     to model attributes via setter methods.
     """
 
+    def _resolve(self, model):
+        """
+        Return the (extraction, test extraction) method names for a model,
+        resolved from its class name once per class and then cached.
+        """
+        model_cls = type(model)
+        methods = _DISPATCH_CACHE.get(model_cls)
+        if methods is None:
+            model_type = model_cls.__name__.lower()
+
+            if "ebeam" in model_type:
+                methods = ("eModelExtraction", "testeModelExtraction")
+            elif "xbeam" in model_type:
+                methods = ("xModelExtraction", "testxModelExtraction")
+            elif "geo" in model_type:
+                methods = ("geoModelExtraction", "testGeoModelExtraction")
+            else:
+                raise TypeError(f"Unsupported model type: {model_cls.__name__}")
+
+            _DISPATCH_CACHE[model_cls] = methods
+        return methods
+
     def extract(self, model):
         """
         Automatically calls the correct extraction method
@@ -39,16 +196,7 @@ class data_extractor:
             - XBeamModel
             - Geo6xfffModel
         """
-        model_type = type(model).__name__.lower()
-
-        if "ebeam" in model_type:
-            return self.eModelExtraction(model)
-        elif "xbeam" in model_type:
-            return self.xModelExtraction(model)
-        elif "geo" in model_type:
-            return self.geoModelExtraction(model)
-        else:
-            raise TypeError(f"Unsupported model type: {type(model).__name__}")
+        return getattr(self, self._resolve(model)[0])(model)
 
     def extractTest(self, model):
         """
@@ -60,59 +208,59 @@ class data_extractor:
             - XBeamModel
             - Geo6xfffModel
         """
-        model_type = type(model).__name__.lower()
-
-        if "ebeam" in model_type:
-            return self.testeModelExtraction(model)
-        elif "xbeam" in model_type:
-            return self.testxModelExtraction(model)
-        elif "geo" in model_type:
-            return self.testGeoModelExtraction(model)
-        else:
-            raise TypeError(f"Unsupported model type: {type(model).__name__}")
-    # --- E-BEAM ---
-    def eModelExtraction(self, eBeam):
+        return getattr(self, self._resolve(model)[1])(model)
+
+    # --- SHARED READER ---
+    def _extract(self, model, setters, leaf_setters=None):
         """
-        Extract data for E-beam model from CSV file
+        Read the model's Results.csv and pass each recognised value to
+        the matching setter.
+
+        `setters` maps a field name (last path component, unit stripped)
+        to a setter name. `leaf_setters` optionally maps an MLC leaf group
+        to an indexed setter name.
         """
-        import os
-        
         try:
             # Get the folder path and construct the CSV file path
-            folder_path = eBeam.get_path()
+            folder_path = model.get_path()
             path = os.path.join(folder_path, "Results.csv")
-            
-            # Parse the CSV file
-            with open(path, 'r', newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                
-                # Read through the CSV rows
-                for row in reader:
-                    name = row.get('Name [Unit]', '').strip()
-                    value = row.get(' Value', '').strip()
-                    if not name or not value:
+
+            for field, name, value in _read_results(path, os.stat(path).st_mtime_ns):
+                # Resolve the target setter first so rows the model does not
+                # track are skipped without parsing their value.
+                setter = setters.get(field)
+                index = None
+                if setter is None:
+                    if leaf_setters is None:
+                        continue
+                    # ---- MLC Leaves / MLC Backlash ----
+                    match = _MLC_LEAF_RE.search(name)
+                    if match is None:
                         continue
-                    
-                    # Convert value to Decimal
-                    try:
-                        dec_val = Decimal(value)
-                    except (ValueError, TypeError, decimal.InvalidOperation):
-                        dec_val = Decimal(-1)
-                    
-                    # Check for relative output (BeamOutputChange)
-                    if 'BeamOutputChange' in name:
-                        eBeam.set_relative_output(dec_val)
-                    
-                    # Check for relative uniformity (BeamUniformityChange)
-                    elif 'BeamUniformityChange' in name:
-                        eBeam.set_relative_uniformity(dec_val)
-                
+                    index = int(match.group(2))
+                    if not 1 <= index <= 60:  # Validate leaf number range (1-60)
+                        continue
+                    setter = leaf_setters[match.group(1)]
+
+                num = _to_number(value)
+
+                if index is None:
+                    getattr(model, setter)(num)
+                else:
+                    getattr(model, setter)(index, num)
+
         except FileNotFoundError:
-            logger.error(f"CSV file not found: {path}")
-        except csv.Error as e:
-            logger.error(f"Error parsing CSV file: {e}")
-        except Exception as e:
-            logger.error(f"Error during extraction: {e}", exc_info=True)
+            logger.error("CSV file not found: %s", path)
+        except (csv.Error, ValueError) as e:
+            # Malformed file: bad CSV, undecodable text or missing header columns
+            logger.error("Error parsing CSV file %s: %s", path, e)
+
+    # --- E-BEAM ---
+    def eModelExtraction(self, eBeam):
+        """
+        Extract data for E-beam model from CSV file
+        """
+        self._extract(eBeam, _E_SETTERS)
 
     def testeModelExtraction(self, eBeam):
         """
@@ -127,48 +275,7 @@ class data_extractor:
         """
         Extract data for X-beam model from CSV file
         """
-        import os
-        
-        try:
-            # Get the folder path and construct the CSV file path
-            folder_path = xBeam.get_path()
-            path = os.path.join(folder_path, "Results.csv")
-            
-            # Parse the CSV file
-            with open(path, 'r', newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                
-                # Read through the CSV rows
-                for row in reader:
-                    name = row.get('Name [Unit]', '').strip()
-                    value = row.get(' Value', '').strip()
-                    if not name or not value:
-                        continue
-                    
-                    # Convert value to Decimal
-                    try:
-                        dec_val = Decimal(value)
-                    except (ValueError, TypeError, decimal.InvalidOperation):
-                        dec_val = Decimal(-1)
-                    
-                    # Check for relative output (BeamOutputChange)
-                    if 'BeamOutputChange' in name:
-                        xBeam.set_relative_output(dec_val)
-                    
-                    # Check for relative uniformity (BeamUniformityChange)
-                    elif 'BeamUniformityChange' in name:
-                        xBeam.set_relative_uniformity(dec_val)
-
-                    # Check for Center Shift (BeamCenterShift)
-                    elif 'BeamCenterShift' in name:
-                        xBeam.set_center_shift(dec_val)
-                
-        except FileNotFoundError:
-            logger.error(f"CSV file not found: {path}")
-        except csv.Error as e:
-            logger.error(f"Error parsing CSV file: {e}")
-        except Exception as e:
-            logger.error(f"Error during extraction: {e}", exc_info=True)
+        self._extract(xBeam, _X_SETTERS)
 
     def testxModelExtraction(self, xBeam):
         """
@@ -177,193 +284,12 @@ class data_extractor:
         """
         self.xModelExtraction(xBeam)
 
-    
     def geoModelExtraction(self, geoModel):
         """
         Extract data for Geo6xfffModel from CSV file.
         Reads each row and calls the appropriate setter.
         """
-        import csv
-        import os
-        from decimal import Decimal, InvalidOperation
-
-        try:
-            # Get the folder path and construct the CSV file path
-            folder_path = geoModel.get_path()
-            path = os.path.join(folder_path, "Results.csv")
-
-            with open(path, 'r', newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    name = row.get('Name [Unit]', '').strip()
-                    value = row.get(' Value', '').strip()
-                    if not name or not value:
-                        continue
-                    
-                    # Convert value to Decimal
-                    try:
-                        dec_val = Decimal(value)
-                    except (ValueError, TypeError, InvalidOperation):
-                        dec_val = Decimal(-1)
-
-                    # ---- IsoCenterGroup ----
-                    if 'IsoCenterSize' in name:
-                        geoModel.set_IsoCenterSize(dec_val)
-                    elif 'IsoCenterMVOffset' in name:
-                        geoModel.set_IsoCenterMVOffset(dec_val)
-                    elif 'IsoCenterKVOffset' in name:
-                        geoModel.set_IsoCenterKVOffset(dec_val)
-
-                    # ---- BeamGroup ----
-                    elif 'BeamOutputChange' in name:
-                        geoModel.set_relative_output(dec_val)
-                    elif 'BeamUniformityChange' in name:
-                        geoModel.set_relative_uniformity(dec_val)
-                    elif 'BeamCenterShift' in name:
-                        geoModel.set_center_shift(dec_val)
-
-                    # ---- CollimationGroup ----
-                    elif 'CollimationRotationOffset' in name:
-                        geoModel.set_CollimationRotationOffset(dec_val)
-
-                    # ---- GantryGroup ----
-                    elif 'GantryAbsolute' in name:
-                        geoModel.set_GantryAbsolute(dec_val)
-                    elif 'GantryRelative' in name:
-                        geoModel.set_GantryRelative(dec_val)
-
-                    # ---- EnhancedCouchGroup ----
-                    elif 'CouchMaxPositionError' in name:
-                        geoModel.set_CouchMaxPositionError(dec_val)
-                    elif 'CouchLat' in name:
-                        geoModel.set_CouchLat(dec_val)
-                    elif 'CouchLng' in name:
-                        geoModel.set_CouchLng(dec_val)
-                    elif 'CouchVrt' in name:
-                        geoModel.set_CouchVrt(dec_val)
-                    elif 'CouchRtnFine' in name:
-                        geoModel.set_CouchRtnFine(dec_val)
-                    elif 'CouchRtnLarge' in name:
-                        geoModel.set_CouchRtnLarge(dec_val)
-                    elif 'RotationInducedCouchShiftFullRange' in name:
-                        geoModel.set_RotationInducedCouchShiftFullRange(dec_val)
-
-                    # ---- MLC Leaves ----
-                    elif 'MLCLeavesA/MLCLeaf' in name or '/MLCLeavesA/MLCLeaf' in name:
-                        try:
-                            # Extract leaf number from patterns like:
-                            # "CollimationGroup/MLCGroup/MLCLeavesA/MLCLeaf11 [mm]"
-                            # or "MLCLeavesA/MLCLeaf11 [mm]"
-                            parts = name.split('MLCLeaf')
-                            if len(parts) > 1:
-                                # Get the part after "MLCLeaf" and extract the number
-                                leaf_part = parts[1].strip()
-                                # Remove brackets and extract number: "11 [mm]" -> "11"
-                                index_str = leaf_part.split()[0] if ' ' in leaf_part else leaf_part.split('[')[0]
-                                index = int(index_str)
-                                if 1 <= index <= 60:  # Validate leaf number range (1-60)
-                                    geoModel.set_MLCLeafA(index, dec_val)
-                        except (ValueError, IndexError, Exception) as e:
-                            # Silently skip invalid entries
-                            pass
-                    elif 'MLCLeavesB/MLCLeaf' in name or '/MLCLeavesB/MLCLeaf' in name:
-                        try:
-                            # Extract leaf number from patterns like:
-                            # "CollimationGroup/MLCGroup/MLCLeavesB/MLCLeaf11 [mm]"
-                            # or "MLCLeavesB/MLCLeaf11 [mm]"
-                            parts = name.split('MLCLeaf')
-                            if len(parts) > 1:
-                                # Get the part after "MLCLeaf" and extract the number
-                                leaf_part = parts[1].strip()
-                                # Remove brackets and extract number: "11 [mm]" -> "11"
-                                index_str = leaf_part.split()[0] if ' ' in leaf_part else leaf_part.split('[')[0]
-                                index = int(index_str)
-                                if 1 <= index <= 60:  # Validate leaf number range (1-60)
-                                    geoModel.set_MLCLeafB(index, dec_val)
-                        except (ValueError, IndexError, Exception) as e:
-                            # Silently skip invalid entries
-                            pass
-
-                    # ---- MLC Offsets ----
-                    elif 'MLCMaxOffsetA' in name or 'MaxOffsetA' in name:
-                        geoModel.set_MaxOffsetA(dec_val)
-                    elif 'MLCMaxOffsetB' in name or 'MaxOffsetB' in name:
-                        geoModel.set_MaxOffsetB(dec_val)
-                    elif 'MLCMeanOffsetA' in name or 'MeanOffsetA' in name:
-                        geoModel.set_MeanOffsetA(dec_val)
-                    elif 'MLCMeanOffsetB' in name or 'MeanOffsetB' in name:
-                        geoModel.set_MeanOffsetB(dec_val)
-
-                    # ---- MLC Backlash ----
-                    elif 'MLCBacklashLeavesA/MLCBacklashLeaf' in name or '/MLCBacklashLeavesA/MLCBacklashLeaf' in name:
-                        try:
-                            # Extract leaf number from patterns like:
-                            # "CollimationGroup/MLCBacklashGroup/MLCBacklashLeavesA/MLCBacklashLeaf11 [mm]"
-                            # or "MLCBacklashLeavesA/MLCBacklashLeaf11 [mm]"
-                            parts = name.split('MLCBacklashLeaf')
-                            if len(parts) > 1:
-                                # Get the part after "MLCBacklashLeaf" and extract the number
-                                leaf_part = parts[1].strip()
-                                # Remove brackets and extract number: "11 [mm]" -> "11"
-                                index_str = leaf_part.split()[0] if ' ' in leaf_part else leaf_part.split('[')[0]
-                                index = int(index_str)
-                                if 1 <= index <= 60:  # Validate leaf number range (1-60)
-                                    geoModel.set_MLCBacklashA(index, dec_val)
-                        except (ValueError, IndexError, Exception) as e:
-                            # Silently skip invalid entries
-                            pass
-                    elif 'MLCBacklashLeavesB/MLCBacklashLeaf' in name or '/MLCBacklashLeavesB/MLCBacklashLeaf' in name:
-                        try:
-                            # Extract leaf number from patterns like:
-                            # "CollimationGroup/MLCBacklashGroup/MLCBacklashLeavesB/MLCBacklashLeaf11 [mm]"
-                            # or "MLCBacklashLeavesB/MLCBacklashLeaf11 [mm]"
-                            parts = name.split('MLCBacklashLeaf')
-                            if len(parts) > 1:
-                                # Get the part after "MLCBacklashLeaf" and extract the number
-                                leaf_part = parts[1].strip()
-                                # Remove brackets and extract number: "11 [mm]" -> "11"
-                                index_str = leaf_part.split()[0] if ' ' in leaf_part else leaf_part.split('[')[0]
-                                index = int(index_str)
-                                if 1 <= index <= 60:  # Validate leaf number range (1-60)
-                                    geoModel.set_MLCBacklashB(index, dec_val)
-                        except (ValueError, IndexError, Exception) as e:
-                            # Silently skip invalid entries
-                            pass
-                    elif 'MLCBacklashMaxA' in name:
-                        geoModel.set_MLCBacklashMaxA(dec_val)
-                    elif 'MLCBacklashMaxB' in name:
-                        geoModel.set_MLCBacklashMaxB(dec_val)
-                    elif 'MLCBacklashMeanA' in name:
-                        geoModel.set_MLCBacklashMeanA(dec_val)
-                    elif 'MLCBacklashMeanB' in name:
-                        geoModel.set_MLCBacklashMeanB(dec_val)
-
-                    # ---- Jaws Group ----
-                    elif 'JawX1' in name:
-                        geoModel.set_JawX1(dec_val)
-                    elif 'JawX2' in name:
-                        geoModel.set_JawX2(dec_val)
-                    elif 'JawY1' in name:
-                        geoModel.set_JawY1(dec_val)
-                    elif 'JawY2' in name:
-                        geoModel.set_JawY2(dec_val)
-
-                    # ---- Jaws Parallelism ----
-                    elif 'JawParallelismX1' in name:
-                        geoModel.set_JawParallelismX1(dec_val)
-                    elif 'JawParallelismX2' in name:
-                        geoModel.set_JawParallelismX2(dec_val)
-                    elif 'JawParallelismY1' in name:
-                        geoModel.set_JawParallelismY1(dec_val)
-                    elif 'JawParallelismY2' in name:
-                        geoModel.set_JawParallelismY2(dec_val)
-
-        except FileNotFoundError:
-            logger.error(f"CSV file not found: {path}")
-        except csv.Error as e:
-            logger.error(f"Error parsing CSV file: {e}")
-        except Exception as e:
-            logger.error(f"Error during extraction: {e}", exc_info=True)
+        self._extract(geoModel, _GEO_SETTERS, _GEO_LEAF_SETTERS)
 
     def testGeoModelExtraction(self, geoModel):
         """
@@ -8,10 +8,15 @@ Supported Image Types:
     - BeamProfileCheck.xim
 """
 
+import hashlib
 import logging
+import os
+from collections import OrderedDict
+from functools import lru_cache
 
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 from pylinac.field_analysis import FieldAnalysis
 from pylinac.core.image import XIM, ArrayImage
@@ -19,46 +24,129 @@ from pylinac.core.image import XIM, ArrayImage
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 
+# Floor applied to the dark-corrected flood field to avoid division by zero
+FLOOD_THRESHOLD = 1e-6
+
+
+@lru_cache(maxsize=4)
+def _load_calibration(dark_path, dark_mtime_ns, flood_path, flood_mtime_ns):
+    """
+    Load the dark frame, the dark-corrected and clamped flood field, and the
+    mask of flood pixels usable as divisors.
+
+    The mtimes are only part of the cache key: re-processing a folder
+    reuses the decoded frames unless either file has been rewritten.
+    Returned arrays are read-only because they are shared between calls.
+    """
+    dark = np.array(XIM(dark_path), dtype=np.float32)
+    flood = np.array(XIM(flood_path), dtype=np.float32)
+
+    # Both steps run in place on the freshly decoded flood frame
+    corrected_flood = np.subtract(flood, dark, out=flood)
+    np.maximum(corrected_flood, FLOOD_THRESHOLD, out=corrected_flood)
+    flood_mask = corrected_flood > FLOOD_THRESHOLD
+
+    for array in (dark, corrected_flood, flood_mask):
+        array.setflags(write=False)
+    return dark, corrected_flood, flood_mask
+
+
+# Metrics and profiles of recent FieldAnalysis runs, keyed by a digest of the
+# normalized image, so re-processing an unchanged image skips the analysis
+_ANALYSIS_CACHE_SIZE = 16
+_analysis_cache = OrderedDict()
+
+_PROTOCOL_KEYS = (
+    'symmetry_horizontal', 'symmetry_vertical',
+    'flatness_horizontal', 'flatness_vertical',
+)
+
+
+def _analyze(normalized):
+    """
+    Run pylinac FieldAnalysis on a normalized image, or reuse the result of
+    an identical earlier image.
+
+    Returns (protocol_results, horizontal profile values, vertical profile values).
+    """
+    # Hash the array's buffer directly rather than a tobytes() copy of it
+    digest = hashlib.blake2b(np.ascontiguousarray(normalized).data, digest_size=16)
+    digest.update(repr((normalized.shape, normalized.dtype.str)).encode())
+    key = digest.digest()
+
+    cached = _analysis_cache.get(key)
+    if cached is not None:
+        _analysis_cache.move_to_end(key)
+        return cached
+
+    img = ArrayImage(normalized, dpi = 280)
+    analysis = FieldAnalysis(img)
+    analysis.analyze()
+    r = analysis.results_data()
+
+    result = (
+        {name: r.protocol_results[name] for name in _PROTOCOL_KEYS},
+        np.array(analysis.horiz_profile.values),
+        np.array(analysis.vert_profile.values),
+    )
+    # Profiles are shared by every hit, so keep them read-only
+    result[1].setflags(write=False)
+    result[2].setflags(write=False)
+    _analysis_cache[key] = result
+    if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+        _analysis_cache.popitem(last=False)
+    return result
+
+
 class image_extractor:
+    def __init__(self):
+        # Scratch buffers for the dark-corrected and normalized frames, reused
+        # across calls (neither array outlives process_image)
+        self._corrected_buf = None
+        self._normalized_buf = None
+
     def process_image(self,imageModel, is_test=False):
         # Load images (you may need to convert XIM to a format pylinac accepts)
         clinicalPath = imageModel.get_path()
         darkPath = imageModel.get_dark_image_path()
         floodPath = imageModel.get_flood_image_path()
-        #Load images as numpy arrays
-        clinical = np.array(XIM(clinicalPath))
-        dark = np.array(XIM(darkPath))
-        flood = np.array(XIM(floodPath))
-        
-        # Apply corrections
-        corrected_flood = flood - dark
-        corrected_clinical = clinical - dark
+        #Load images as float32 numpy arrays so the whole correction runs in fp32
+        clinical = np.array(XIM(clinicalPath), dtype=np.float32)
+        # Dark and flood frames are cached, with the flood already dark-corrected
+        # and clamped to avoid division by zero
+        dark, corrected_flood, flood_mask = _load_calibration(
+            darkPath, os.stat(darkPath).st_mtime_ns,
+            floodPath, os.stat(floodPath).st_mtime_ns,
+        )
         
-        # Avoid division by zero
-        threshold = 1e-6
-        corrected_flood[corrected_flood < threshold] = threshold
+        # Apply corrections. The corrected frame never leaves this call, so it is
+        # written into a reused buffer rather than a fresh allocation each time.
+        if self._corrected_buf is None or self._corrected_buf.shape != clinical.shape:
+            self._corrected_buf = np.empty(clinical.shape, dtype=np.float32)
+            self._normalized_buf = np.empty(clinical.shape, dtype=np.float32)
+        corrected_clinical = np.subtract(clinical, dark, out=self._corrected_buf)
         
-        # Normalize
+        # Normalize. Pixels outside the flood mask are not written by the divide,
+        # so the reused output is zeroed first.
         #normalized = corrected_clinical / corrected_flood
-        normalized = np.divide(
+        normalized = self._normalized_buf
+        normalized.fill(0)
+        np.divide(
         corrected_clinical,
         corrected_flood,
-        out=np.zeros_like(corrected_clinical, dtype=np.float32),
-        where=corrected_flood > threshold
+        out=normalized,
+        where=flood_mask
         )
 
-        img = ArrayImage(normalized, dpi = 280)
-        analysis = FieldAnalysis(img)
-        analysis.analyze()
-        r = analysis.results_data()
+        protocol_results, horiz_values, vert_values = _analyze(normalized)
         
         #Extract and store horizontal and vertical flatness graphs
-        self.create_graphs(analysis, imageModel)
+        self.create_graphs(horiz_values, vert_values, imageModel)
 
-        imageModel.set_symmetry_horizontal(r.protocol_results['symmetry_horizontal'])
-        imageModel.set_symmetry_vertical(r.protocol_results['symmetry_vertical'])
-        imageModel.set_flatness_horizontal(r.protocol_results['flatness_horizontal'])
-        imageModel.set_flatness_vertical(r.protocol_results['flatness_vertical'])
+        imageModel.set_symmetry_horizontal(protocol_results['symmetry_horizontal'])
+        imageModel.set_symmetry_vertical(protocol_results['symmetry_vertical'])
+        imageModel.set_flatness_horizontal(protocol_results['flatness_horizontal'])
+        imageModel.set_flatness_vertical(protocol_results['flatness_vertical'])
         if is_test:
             # Print numerical analysis results to the console
             logger.info(f"Flatness (Horizontal): {imageModel.get_flatness_horizontal()}")
@@ -72,26 +160,28 @@ class image_extractor:
             fig.savefig("vertical_profile.png") 
 
     
-    def create_graphs(self, analysis, imageModel):
+    def create_graphs(self, horiz_values, vert_values, imageModel):
+        # Figures are built directly on an Agg canvas rather than through pyplot,
+        # so they are never registered with the pyplot figure manager and need
+        # no plt.close() to avoid lingering
         # Horizontal profile
-        h = analysis.horiz_profile
-        fig_h, ax_h = plt.subplots()  # Create Figure and Axes
-        ax_h.plot(h.values)
+        fig_h = Figure()
+        FigureCanvasAgg(fig_h)
+        ax_h = fig_h.subplots()  # Create Axes
+        ax_h.plot(horiz_values)
         ax_h.set_title("Horizontal Profile")
         ax_h.set_xlabel("Pixel")
         ax_h.set_ylabel("Intensity")
         ax_h.grid(True)
         imageModel.set_horizontal_profile_graph(fig_h)  # store the Figure
-        plt.close(fig_h)  # prevent automatic display
 
         # Vertical profile
-        v = analysis.vert_profile
-        fig_v, ax_v = plt.subplots()
-        ax_v.plot(v.values)
+        fig_v = Figure()
+        FigureCanvasAgg(fig_v)
+        ax_v = fig_v.subplots()
+        ax_v.plot(vert_values)
         ax_v.set_title("Vertical Profile")
         ax_v.set_xlabel("Pixel")
         ax_v.set_ylabel("Intensity")
         ax_v.grid(True)
         imageModel.set_vertical_profile_graph(fig_v)
-        plt.close(fig_v)
-
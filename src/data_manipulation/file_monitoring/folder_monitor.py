@@ -12,6 +12,7 @@ import os
 import sys
 import time
 import logging
+import threading
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -53,6 +54,11 @@ class iDriveFolderHandler(FileSystemEventHandler):
         self.processed_folders = set()  # Track processed folders to avoid duplicates
         self.supabase_url = supabase_url
         self.supabase_key = supabase_key
+        # One processor for every folder so the database connection is reused.
+        # Each monitored path has its own Observer thread, and the processor keeps
+        # per-folder state and image buffers, so runs go through the lock one at a time.
+        self.processor = DataProcessor()
+        self.processor_lock = threading.Lock()
         
     def on_created(self, event):
         """
@@ -99,14 +105,10 @@ class iDriveFolderHandler(FileSystemEventHandler):
             # Mark as processed to avoid duplicates
             self.processed_folders.add(folder_path)
             
-            # Create DataProcessor instance and run processing
+            # Run the shared DataProcessor on this folder
             logger.info(f"Processing folder: {folder_path}")
-            processor = DataProcessor(
-                folder_path, 
-                supabase_url=self.supabase_url,
-                supabase_key=self.supabase_key
-            )
-            processor.Run()
+            with self.processor_lock:
+                self.processor.Run(folder_path)
             
             logger.info(f"Successfully processed folder: {folder_path}")
             
@@ -226,6 +228,8 @@ class FolderMonitor:
             for observer in self.observers:
                 observer.join()
             self.observers = []
+            with self.handler.processor_lock:
+                self.handler.processor.close()
             self.is_running = False
             logger.info("Folder monitoring stopped")
     
@@ -242,12 +246,15 @@ class FolderMonitor:
                     continue
                 
                 logger.info(f"Scanning: {idrive_path}")
-                for item in os.listdir(idrive_path):
-                    item_path = os.path.join(idrive_path, item)
-                    if os.path.isdir(item_path):
-                        logger.info(f"Found existing folder: {item_path}")
-                        # Process existing folder if it hasn't been processed
-                        self.handler._process_new_folder(item_path)
+                # scandir reports the entry type from the directory listing itself,
+                # avoiding a stat() per entry on slow external/network drives
+                with os.scandir(idrive_path) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            item_path = entry.path
+                            logger.info(f"Found existing folder: {item_path}")
+                            # Process existing folder if it hasn't been processed
+                            self.handler._process_new_folder(item_path)
                     
         except Exception as e:
             logger.error(f"Error scanning existing folders: {str(e)}")
@@ -4,6 +4,9 @@ import re
 import xml.etree.ElementTree as ET
 import os
 
+# Namespace used in Check.xml
+_MPC_NS = {'mpc': 'http://www.varian.com/MPC'}
+
 class AbstractBeamModel(ABC):
     def __init__(self):
         self._type = ""
@@ -152,13 +155,10 @@ class AbstractBeamModel(ABC):
         if not os.path.exists(check_xml_path):
             raise FileNotFoundError(f"Check.xml not found in directory: {directory}")
 
-        # Namespace used in the XML
-        ns = {'mpc': 'http://www.varian.com/MPC'}
-
         try:
             tree = ET.parse(check_xml_path)
             root = tree.getroot()
-            elem = root.find('mpc:IsBaseline', ns)
+            elem = root.find('mpc:IsBaseline', _MPC_NS)
 
             if elem is None or elem.text is None:
                 raise ValueError(f"<IsBaseline> tag not found in file: {check_xml_path}")
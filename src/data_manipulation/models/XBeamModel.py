@@ -1,12 +1,11 @@
 from src.data_manipulation.models.AbstractBeamModel import AbstractBeamModel
-from decimal import Decimal
 
 class XBeamModel(AbstractBeamModel):
     def __init__(self):
         super().__init__()
-        self._relative_uniformity = Decimal('0.0')
-        self._relative_output = Decimal('0.0')
-        self._center_shift = Decimal('0.0')
+        self._relative_uniformity = 0.0
+        self._relative_output = 0.0
+        self._center_shift = 0.0
     
     # Getters
     def get_relative_uniformity(self):